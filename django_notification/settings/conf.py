@@ -1,7 +1,6 @@
 from typing import Any, List, Optional, Type, Union
 
 from django.conf import settings
-from django.utils.module_loading import import_string
 
 from django_notification.constants.default_settings import (
     DefaultAdminSettings,
@@ -10,6 +9,7 @@ from django_notification.constants.default_settings import (
     DefaultSerializerSettings,
     DefaultThrottleSettings,
 )
+from django_notification.utils.module_loading import import_optional_class
 
 
 # pylint: disable=too-many-instance-attributes
@@ -164,6 +164,9 @@ class NotificationConfig:
         """Dynamically load a class based on a setting, or return None if the
         setting is None or invalid.
 
+        Import results are cached per path, so repeated lookups of the same
+        path (including ones that failed) do not import it again.
+
         Args:
             setting_name (str): The name of the setting for the class path.
             default_path (Optional[Union[str, List[str]]): The default import path for the class.
@@ -178,19 +181,16 @@ class NotificationConfig:
         )
 
         if class_path and isinstance(class_path, str):
-            try:
-                return import_string(class_path)
-            except ImportError:
-                return None
+            return import_optional_class(class_path)[1]
         elif class_path and isinstance(class_path, list):
-            try:
-                return [
-                    import_string(cls_path)
-                    for cls_path in class_path
-                    if isinstance(cls_path, str)
-                ]
-            except ImportError:
-                return []
+            classes: List[Type[Any]] = []
+            for cls_path in class_path:
+                if isinstance(cls_path, str):
+                    imported, cls = import_optional_class(cls_path)
+                    if not imported:
+                        return []
+                    classes.append(cls)
+            return classes
 
         return None
 
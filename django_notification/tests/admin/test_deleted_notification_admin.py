@@ -1,4 +1,3 @@
-import sys
 from unittest.mock import Mock
 import pytest
 from django.contrib import admin
@@ -7,12 +6,10 @@ from django.test import Client
 from django.urls import reverse
 from django_notification.models import DeletedNotification
 from django_notification.admin import DeletedNotificationAdmin
-from django_notification.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
 
 pytestmark = [
     pytest.mark.admin,
     pytest.mark.admin_deleted_notification,
-    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
 ]
 
 
@@ -1,5 +1,4 @@
-import sys
-from typing import List
+from typing import Tuple
 from unittest.mock import Mock
 
 import pytest
@@ -17,12 +16,10 @@ from django_notification.admin.notification import (
     NotificationRecipientInline,
     NotificationSeenInline,
 )
-from django_notification.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
 
 pytestmark = [
     pytest.mark.admin,
     pytest.mark.admin_notification,
-    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
 ]
 
 
@@ -198,7 +195,7 @@ class TestNotificationAdminSite:
         ), "'user' field not optimized with select_related."
 
     def test_mark_all_as_sent_action(
-        self, admin_user: User, notifications: List[Notification]
+        self, admin_user: User, notifications: Tuple[Notification, ...]
     ) -> None:
         """
         Test the 'mark_as_sent' action in the NotificationAdmin interface for bulk marking notifications as sent.
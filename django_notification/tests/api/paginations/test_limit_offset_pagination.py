@@ -1,16 +1,13 @@
-import sys
 import pytest
 from rest_framework.request import Request
 from rest_framework.test import APIRequestFactory
 from django_notification.api.paginations.limit_offset_pagination import (
     DefaultLimitOffSetPagination,
 )
-from django_notification.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
 
 pytestmark = [
     pytest.mark.api,
     pytest.mark.api_paginations,
-    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
 ]
 
 
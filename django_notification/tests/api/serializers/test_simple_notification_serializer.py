@@ -1,4 +1,3 @@
-import sys
 from typing import Dict, Any
 from unittest.mock import patch
 
@@ -13,13 +12,11 @@ from django_notification.utils.serialization.field_filters import (
 )
 from django_notification.utils.serialization.notif_title_generator import generate_title
 from pytest import mark
-from django_notification.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
 
 pytestmark = [
     pytest.mark.api,
     pytest.mark.api_serializers,
     pytest.mark.api_serializers_simple_notification,
-    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
 ]
 
 
@@ -1,5 +1,3 @@
-import sys
-
 import pytest
 from django.contrib.auth.models import User
 from rest_framework.request import Request
@@ -12,12 +10,10 @@ from django_notification.api.throttlings.role_base_throttle import (
     RoleBasedUserRateThrottle,
 )
 from django_notification.settings.conf import config
-from django_notification.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
 
 pytestmark = [
     pytest.mark.api,
     pytest.mark.api_throttlings,
-    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
 ]
 
 
@@ -1,23 +1,44 @@
-import sys
+from typing import Callable, Tuple
 
 import pytest
 from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from rest_framework.test import APIClient
-from unittest.mock import patch
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
 
-from django_notification.models import DeletedNotification
+from django_notification.api.views.activity import ActivityViewSet
+from django_notification.models import (
+    DeletedNotification,
+    NotificationSeen,
+)
 from django_notification.models.notification import Notification
 from django_notification.settings.conf import config
-from django_notification.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
 
 pytestmark = [
     pytest.mark.api,
     pytest.mark.api_views,
     pytest.mark.api_views_activity,
-    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
 ]
 
+# Resolve URLs once at import; detail URLs are formatted with the pk per test.
+ACTIVITIES_LIST_URL = reverse("activities-list")
+ACTIVITIES_DETAIL_URL = reverse("activities-detail", kwargs={"pk": 0}).replace(
+    "/0/", "/{}/"
+)
+CLEAR_ACTIVITIES_URL = reverse("activities-clear-activities")
+CLEAR_NOTIFICATION_URL = reverse(
+    "activities-clear-notification", kwargs={"pk": 0}
+).replace("/0/", "/{}/")
+DELETE_ACTIVITIES_URL = reverse("activities-delete-activities")
+DELETE_NOTIFICATION_URL = reverse(
+    "activities-delete-notification", kwargs={"pk": 0}
+).replace("/0/", "/{}/")
+
+# GET-only tests call the viewset directly through APIRequestFactory.
+ACTIVITY_LIST_VIEW = ActivityViewSet.as_view({"get": "list"})
+ACTIVITY_DETAIL_VIEW = ActivityViewSet.as_view({"get": "retrieve"})
+
 
 @pytest.mark.django_db
 class TestActivityViewSet:
@@ -31,12 +52,59 @@ class TestActivityViewSet:
 
     def setup_method(self) -> None:
         """
-        Setup the test client and create test data before each test.
+        Setup the test client and request factory before each test.
         """
         self.client = APIClient()
+        self.factory = APIRequestFactory()
+
+    def render_list(self, user: User) -> Tuple[int, int]:
+        """
+        Render the activity list for a user, counting the queries it runs.
+
+        Args:
+        ----
+            user (User): The user requesting the list.
+
+        Returns:
+        -------
+            Tuple[int, int]: The number of results returned and the number of queries run.
+        """
+        request = self.factory.get(ACTIVITIES_LIST_URL)
+        force_authenticate(request, user=user)
+        with CaptureQueriesContext(connection) as ctx:
+            response = ACTIVITY_LIST_VIEW(request)
+        assert response.status_code == 200
+        return len(response.data.get("results")), len(ctx.captured_queries)
+
+    @pytest.fixture
+    def expected_seen_count(
+        self,
+        admin_user: User,
+        notification: Notification,
+        notification_for: Callable[..., Notification],
+    ) -> int:
+        """
+        Deliver three notifications already seen by the admin user and count them once.
+
+        Args:
+        ----
+            admin_user (User): An admin user instance.
+            notification (Notification): A notification instance the admin user has not seen.
+            notification_for (Callable[..., Notification]): Factory creating a notification for a user.
+
+        Returns:
+        -------
+            int: The number of notifications seen by the admin user.
+        """
+        for _ in range(3):
+            notification_for(admin_user, seen=True)
+        return Notification.objects.seen(seen_by=admin_user).values("id").count()
 
     def test_get_queryset_for_staff(
-        self, admin_user: User, notification: Notification
+        self,
+        admin_user: User,
+        expected_seen_count: int,
+        notification_for: Callable[..., Notification],
     ) -> None:
         """
         Test that staff users can retrieve all seen notifications.
@@ -44,24 +112,30 @@ class TestActivityViewSet:
         Args:
         ----
             admin_user (User): An admin user instance.
-            notification (Notification): A notification instance.
+            expected_seen_count (int): The number of notifications seen by the admin user.
+            notification_for (Callable[..., Notification]): Factory creating a notification for a user.
 
         Asserts:
         -------
             - The response status code is 200.
             - The number of notifications returned matches the number of seen notifications for the admin user.
+            - The number of queries does not grow with the number of rows (no N+1).
         """
-        self.client.force_authenticate(user=admin_user)
-        url = reverse("activities-list")
-        response = self.client.get(url)
-        assert response.status_code == 200
-        assert (
-            len(response.data.get("results"))
-            == Notification.objects.seen(seen_by=admin_user).count()
-        )
+        results, queries = self.render_list(admin_user)
+        assert expected_seen_count == 3
+        assert results == expected_seen_count
+
+        for _ in range(2):
+            notification_for(admin_user, seen=True)
+        more_results, more_queries = self.render_list(admin_user)
+        assert more_results == expected_seen_count + 2
+        assert more_queries == queries
 
     def test_get_queryset_for_non_staff(
-        self, user: User, notification: Notification
+        self,
+        user: User,
+        notification: Notification,
+        notification_for: Callable[..., Notification],
     ) -> None:
         """
         Test that non-staff users retrieve notifications based on their group memberships.
@@ -69,64 +143,79 @@ class TestActivityViewSet:
         Args:
         ----
             user (User): A regular user instance.
-            notification (Notification): A notification instance.
+            notification (Notification): A notification instance the user has not seen.
+            notification_for (Callable[..., Notification]): Factory creating a notification for a user.
 
         Asserts:
         -------
             - The response status code is 200.
             - The number of notifications returned matches the number of seen notifications for the user.
+            - The number of queries does not grow with the number of rows (no N+1).
         """
-        self.client.force_authenticate(user=user)
-        url = reverse("activities-list")
-        response = self.client.get(url)
-        assert response.status_code == 200
+        notification_for(user, seen=True)
+        results, queries = self.render_list(user)
+        assert results == 1
+
+        for _ in range(4):
+            notification_for(user, seen=True)
+        more_results, more_queries = self.render_list(user)
         assert (
-            len(response.data.get("results"))
+            more_results
             == Notification.objects.seen(seen_by=user, recipients=user).count()
+            == 5
         )
-
-    @patch.object(config, "api_allow_list", False)
-    def test_list_method_disabled(self, user: User) -> None:
-        """
-        Test that the list method is disabled when `api_allow_list` is False in the config.
-
-        Args:
-        ----
-            user (User): A regular user instance.
-
-        Asserts:
-        -------
-            - The response status code is 405 (Method Not Allowed).
-        """
-        self.client.force_authenticate(user=user)
-        url = reverse("activities-list")
-        response = self.client.get(url)
-        assert response.status_code == 405  # Method Not Allowed
-
-    @patch.object(config, "api_allow_retrieve", False)
-    def test_retrieve_method_disabled(
-        self, user: User, notification: Notification
+        assert more_queries == queries
+
+    @pytest.mark.parametrize(
+        "setting, view, detail",
+        [
+            ("api_allow_list", ACTIVITY_LIST_VIEW, False),
+            ("api_allow_retrieve", ACTIVITY_DETAIL_VIEW, True),
+        ],
+        ids=["list", "retrieve"],
+    )
+    def test_method_disabled(
+        self,
+        user: User,
+        notification: Notification,
+        monkeypatch: pytest.MonkeyPatch,
+        setting: str,
+        view: Callable,
+        detail: bool,
     ) -> None:
         """
-        Test that the retrieve method is disabled when `api_allow_retrieve` is False in the config.
+        Test that the list and retrieve methods are disabled when their config flag is False.
 
         Args:
         ----
             user (User): A regular user instance.
             notification (Notification): A notification instance.
+            monkeypatch (pytest.MonkeyPatch): Fixture used to override config values.
+            setting (str): The config flag to disable (`api_allow_list` or `api_allow_retrieve`).
+            view (Callable): The viewset callable bound to the action under test.
+            detail (bool): Whether the action is a detail (retrieve) route.
 
         Asserts:
         -------
             - The response status code is 405 (Method Not Allowed).
         """
-        self.client.force_authenticate(user=user)
-        url = reverse("activities-detail", kwargs={"pk": notification.pk})
-        response = self.client.get(url)
+        monkeypatch.setattr(config, setting, False)
+        kwargs = {"pk": notification.pk} if detail else {}
+        url = (
+            ACTIVITIES_DETAIL_URL.format(notification.pk)
+            if detail
+            else ACTIVITIES_LIST_URL
+        )
+        request = self.factory.get(url)
+        force_authenticate(request, user=user)
+        response = view(request, **kwargs)
         assert response.status_code == 405  # Method Not Allowed
 
-    @patch.object(config, "include_serializer_full_details", True)
     def test_full_details_serializer_used(
-        self, user: User, notification: Notification
+        self,
+        user: User,
+        notification_for: Callable[..., Notification],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """
         Test that the full details serializer is used when `include_serializer_full_details` is True.
@@ -134,30 +223,33 @@ class TestActivityViewSet:
         Args:
         ----
             user (User): A regular user instance.
-            notification (Notification): A notification instance.
+            notification_for (Callable[..., Notification]): Factory creating a notification for a user.
+            monkeypatch (pytest.MonkeyPatch): Fixture used to override config values.
 
         Asserts:
         -------
             - The response status code is 200.
             - The response data includes 'recipient' and 'seen_by' fields.
         """
-        self.client.force_authenticate(user=user)
-        notification.recipient.add(user)
-        notification.seen_by.add(user)
+        monkeypatch.setattr(config, "include_serializer_full_details", True)
+        notification = notification_for(user, seen=True)
 
-        url = reverse("activities-detail", kwargs={"pk": notification.pk})
-        response = self.client.get(url)
+        request = self.factory.get(ACTIVITIES_DETAIL_URL.format(notification.pk))
+        force_authenticate(request, user=user)
+        response = ACTIVITY_DETAIL_VIEW(request, pk=notification.pk)
         assert response.status_code == 200
         assert "recipient", "seen_by" in response.data
 
-    def test_clear_activities(self, user: User, notification: Notification) -> None:
+    def test_clear_activities(
+        self, user: User, notification_for: Callable[..., Notification]
+    ) -> None:
         """
         Test the clear_activities action to soft delete all notifications.
 
         Args:
         ----
             user (User): A regular user instance.
-            notification (Notification): A notification instance.
+            notification_for (Callable[..., Notification]): Factory creating a notification for a user.
 
         Asserts:
         -------
@@ -165,12 +257,10 @@ class TestActivityViewSet:
             - The number of soft-deleted notifications matches the number of sent notifications.
         """
         self.client.force_authenticate(user=user)
-        notification.recipient.add(user)
-        # First, mark all notifications as seen
-        url = reverse("notifications-mark-all-as-seen")
-        self.client.get(url)
+        # Deliver the notification already marked as seen
+        notification_for(user, seen=True)
 
-        url = reverse("activities-clear-activities")
+        url = CLEAR_ACTIVITIES_URL
         response = self.client.get(url)
         assert response.status_code == 204  # No Content
         assert (
@@ -196,14 +286,16 @@ class TestActivityViewSet:
         self.client.force_authenticate(user=admin_user)
         notification.seen_by.add(admin_user)
 
-        url = reverse("activities-clear-notification", kwargs={"pk": notification.pk})
+        url = CLEAR_NOTIFICATION_URL.format(notification.pk)
         response = self.client.get(url)
         assert response.status_code == 204  # No Content
         assert DeletedNotification.objects.filter(notification=notification).exists()
 
-    @patch.object(config, "include_hard_delete", True)
     def test_delete_activities(
-        self, admin_user: User, notification: Notification
+        self,
+        admin_user: User,
+        notification: Notification,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """
         Test the delete_activities action to hard delete all notifications.
@@ -212,26 +304,34 @@ class TestActivityViewSet:
         ----
             admin_user (User): An admin user instance.
             notification (Notification): A notification instance.
+            monkeypatch (pytest.MonkeyPatch): Fixture used to override config values.
 
         Asserts:
         -------
             - The response status code is 204 (No Content).
             - No notifications remain in the database.
         """
+        monkeypatch.setattr(config, "include_hard_delete", True)
 
         self.client.force_authenticate(user=admin_user)
         # First, mark all notifications as seen
-        url = reverse("notifications-mark-all-as-seen")
-        self.client.get(url)
+        NotificationSeen.objects.bulk_create(
+            [
+                NotificationSeen(notification=notification, user=admin_user)
+                for notification in Notification.objects.all()
+            ]
+        )
 
-        url = reverse("activities-delete-activities")
+        url = DELETE_ACTIVITIES_URL
         response = self.client.get(url)
         assert response.status_code == 204  # No Content
         assert not Notification.objects.all_notifications()
 
-    @patch.object(config, "include_hard_delete", True)
     def test_delete_notification(
-        self, admin_user: User, notification: Notification
+        self,
+        admin_user: User,
+        notification: Notification,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """
         Test the delete_notification action to hard delete a specific notification.
@@ -240,15 +340,17 @@ class TestActivityViewSet:
         ----
             admin_user (User): An admin user instance.
             notification (Notification): A notification instance.
+            monkeypatch (pytest.MonkeyPatch): Fixture used to override config values.
 
         Asserts:
         -------
             - The response status code is 204 (No Content).
             - The specific notification does not exist in the database.
         """
+        monkeypatch.setattr(config, "include_hard_delete", True)
         notification.seen_by.add(admin_user)
         self.client.force_authenticate(user=admin_user)
-        url = reverse("activities-delete-notification", kwargs={"pk": notification.pk})
+        url = DELETE_NOTIFICATION_URL.format(notification.pk)
         response = self.client.get(url)
         assert response.status_code == 204  # No Content
         assert not Notification.objects.filter(pk=notification.pk).exists()
@@ -1,24 +1,34 @@
-import sys
-from typing import Type
-from unittest.mock import patch
+from typing import Callable, Tuple, Type
 
 import pytest
 from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.test import APIClient
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
 
+from django_notification.api.views.notification import NotificationViewSet
 from django_notification.models.notification import Notification
 from django_notification.settings.conf import config
-from django_notification.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
 
 pytestmark = [
     pytest.mark.api,
     pytest.mark.api_views,
     pytest.mark.api_views_notification,
-    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
 ]
 
+# Resolve URLs once at import; detail URLs are formatted with the pk per test.
+NOTIFICATIONS_LIST_URL = reverse("notifications-list")
+NOTIFICATIONS_DETAIL_URL = reverse("notifications-detail", kwargs={"pk": 0}).replace(
+    "/0/", "/{}/"
+)
+MARK_ALL_AS_SEEN_URL = reverse("notifications-mark-all-as-seen")
+
+# GET-only tests call the viewset directly through APIRequestFactory.
+NOTIFICATION_LIST_VIEW = NotificationViewSet.as_view({"get": "list"})
+NOTIFICATION_DETAIL_VIEW = NotificationViewSet.as_view({"get": "retrieve"})
+
 
 @pytest.mark.django_db
 class TestNotificationViewSet:
@@ -32,13 +42,36 @@ class TestNotificationViewSet:
 
     def setup_method(self) -> None:
         """
-        Initialize the test client before each test.
+        Initialize the test client and request factory before each test.
         """
         self.client = APIClient()
+        self.factory = APIRequestFactory()
+
+    def render_list(self, user: Type[User]) -> Tuple[int, int]:
+        """
+        Render the notification list for a user, counting the queries it runs.
+
+        Args:
+        ----
+            user (Type[User]): The user requesting the list.
+
+        Returns:
+        -------
+            Tuple[int, int]: The number of results returned and the number of queries run.
+        """
+        request = self.factory.get(NOTIFICATIONS_LIST_URL)
+        force_authenticate(request, user=user)
+        with CaptureQueriesContext(connection) as ctx:
+            response = NOTIFICATION_LIST_VIEW(request)
+        assert response.status_code == 200
+        return len(response.data.get("results", [])), len(ctx.captured_queries)
 
-    @patch.object(config, "exclude_serializer_null_fields", False)
     def test_get_queryset_for_staff(
-        self, admin_user: Type[User], notification: Notification
+        self,
+        admin_user: Type[User],
+        notification: Notification,
+        notification_for: Callable[..., Notification],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """
         Test that staff users retrieve all unseen notifications.
@@ -47,26 +80,37 @@ class TestNotificationViewSet:
         ----
             admin_user (Type[User]): An admin user instance.
             notification (Notification): A notification instance.
+            notification_for (Callable[..., Notification]): Factory creating a notification for a user.
+            monkeypatch (pytest.MonkeyPatch): Fixture used to override config values.
 
         Asserts:
         -------
             - The response status code is 200.
             - The number of unseen notifications matches the expected count.
+            - The number of queries does not grow with the number of rows (no N+1).
         """
+        monkeypatch.setattr(config, "exclude_serializer_null_fields", False)
         # Set config to test extra permission attribute
-        config.api_extra_permission_class = IsAuthenticated
+        monkeypatch.setattr(config, "api_extra_permission_class", IsAuthenticated)
 
-        self.client.force_authenticate(user=admin_user)
-        url = reverse("notifications-list")
-        response = self.client.get(url)
-        assert response.status_code == 200
+        results, queries = self.render_list(admin_user)
+        assert results == 1
+
+        for _ in range(4):
+            notification_for(admin_user)
+        more_results, more_queries = self.render_list(admin_user)
         assert (
-            len(response.data.get("results", []))
+            more_results
             == Notification.objects.unseen(unseen_by=admin_user).count()
+            == 5
         )
+        assert more_queries == queries
 
     def test_get_queryset_for_non_staff(
-        self, user: Type[User], notification: Notification
+        self,
+        user: Type[User],
+        notification: Notification,
+        notification_for: Callable[..., Notification],
     ) -> None:
         """
         Test that non-staff users retrieve unseen notifications based on their group memberships.
@@ -74,24 +118,31 @@ class TestNotificationViewSet:
         Args:
         ----
             user (Type[User]): A regular user instance.
-            notification (Notification): A notification instance.
+            notification (Notification): A notification instance not delivered to the user.
+            notification_for (Callable[..., Notification]): Factory creating a notification for a user.
 
         Asserts:
         -------
             - The response status code is 200.
             - The number of unseen notifications matches the expected count.
+            - The number of queries does not grow with the number of rows (no N+1).
         """
-        self.client.force_authenticate(user=user)
-        url = reverse("notifications-list")
-        response = self.client.get(url)
-        assert response.status_code == 200
+        notification_for(user)
+        results, queries = self.render_list(user)
+        assert results == 1
+
+        for _ in range(4):
+            notification_for(user)
+        more_results, more_queries = self.render_list(user)
         assert (
-            len(response.data.get("results", []))
-            == Notification.objects.unseen(unseen_by=user).count()
+            more_results
+            == Notification.objects.unseen(unseen_by=user, recipients=user).count()
+            == 5
         )
+        assert more_queries == queries
 
     def test_retrieve_notification(
-        self, user: Type[User], notification: Notification
+        self, user: Type[User], notification_for: Callable[..., Notification]
     ) -> None:
         """
         Test the retrieve functionality to get a specific notification and mark it as seen.
@@ -99,17 +150,17 @@ class TestNotificationViewSet:
         Args:
         ----
             user (Type[User]): A regular user instance.
-            notification (Notification): A notification instance.
+            notification_for (Callable[..., Notification]): Factory creating a notification for a user.
 
         Asserts:
         -------
             - The response status code is 200.
             - The notification is marked as seen by the user.
         """
-        notification.recipient.add(user)
-        self.client.force_authenticate(user=user)
-        url = reverse("notifications-detail", kwargs={"pk": notification.pk})
-        response = self.client.get(url)
+        notification = notification_for(user)
+        request = self.factory.get(NOTIFICATIONS_DETAIL_URL.format(notification.pk))
+        force_authenticate(request, user=user)
+        response = NOTIFICATION_DETAIL_VIEW(request, pk=notification.pk)
         assert response.status_code == 200
         assert Notification.objects.seen(seen_by=user).exists()
 
@@ -130,54 +181,62 @@ class TestNotificationViewSet:
             - The response data includes the detail message indicating notifications were marked as seen.
         """
         self.client.force_authenticate(user=user)
-        url = reverse("notifications-mark-all-as-seen")
+        url = MARK_ALL_AS_SEEN_URL
         response = self.client.get(url)
         assert response.status_code == 200
         assert "Notifications marked as seen" in response.data.get("detail", "")
 
-    @patch.object(config, "api_allow_list", False)
-    def test_list_method_disabled(self, user: Type[User]) -> None:
-        """
-        Test that the list method is disabled when `api_allow_list` is False in the config.
-
-        Args:
-        ----
-            user (Type[User]): A regular user instance.
-
-        Asserts:
-        -------
-            - The response status code is 405 (Method Not Allowed).
-        """
-        self.client.force_authenticate(user=user)
-        url = reverse("notifications-list")
-        response = self.client.get(url)
-        assert response.status_code == 405  # Method Not Allowed
-
-    @patch.object(config, "api_allow_retrieve", False)
-    def test_retrieve_method_disabled(
-        self, user: Type[User], notification: Notification
+    @pytest.mark.parametrize(
+        "setting, view, detail",
+        [
+            ("api_allow_list", NOTIFICATION_LIST_VIEW, False),
+            ("api_allow_retrieve", NOTIFICATION_DETAIL_VIEW, True),
+        ],
+        ids=["list", "retrieve"],
+    )
+    def test_method_disabled(
+        self,
+        user: Type[User],
+        notification_for: Callable[..., Notification],
+        monkeypatch: pytest.MonkeyPatch,
+        setting: str,
+        view: Callable,
+        detail: bool,
     ) -> None:
         """
-        Test that the retrieve method is disabled when `api_allow_retrieve` is False in the config.
+        Test that the list and retrieve methods are disabled when their config flag is False.
 
         Args:
         ----
             user (Type[User]): A regular user instance.
-            notification (Notification): A notification instance.
+            notification_for (Callable[..., Notification]): Factory creating a notification for a user.
+            monkeypatch (pytest.MonkeyPatch): Fixture used to override config values.
+            setting (str): The config flag to disable (`api_allow_list` or `api_allow_retrieve`).
+            view (Callable): The viewset callable bound to the action under test.
+            detail (bool): Whether the action is a detail (retrieve) route.
 
         Asserts:
         -------
             - The response status code is 405 (Method Not Allowed).
         """
-        notification.recipient.add(user)
-        self.client.force_authenticate(user=user)
-        url = reverse("notifications-detail", kwargs={"pk": notification.pk})
-        response = self.client.get(url)
+        monkeypatch.setattr(config, setting, False)
+        notification = notification_for(user)
+        kwargs = {"pk": notification.pk} if detail else {}
+        url = (
+            NOTIFICATIONS_DETAIL_URL.format(notification.pk)
+            if detail
+            else NOTIFICATIONS_LIST_URL
+        )
+        request = self.factory.get(url)
+        force_authenticate(request, user=user)
+        response = view(request, **kwargs)
         assert response.status_code == 405  # Method Not Allowed
 
-    @patch.object(config, "include_serializer_full_details", True)
     def test_full_details_serializer_used(
-        self, user: Type[User], notification: Notification
+        self,
+        user: Type[User],
+        notification_for: Callable[..., Notification],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """
         Test that the full details serializer is used when `include_serializer_full_details` is True in the config.
@@ -185,14 +244,16 @@ class TestNotificationViewSet:
         Args:
         ----
             user (Type[User]): A regular user instance.
-            notification (Notification): A notification instance.
+            notification_for (Callable[..., Notification]): Factory creating a notification for a user.
+            monkeypatch (pytest.MonkeyPatch): Fixture used to override config values.
 
         Asserts:
         -------
             - The response status code is 200.
         """
-        notification.recipient.add(user)
-        self.client.force_authenticate(user=user)
-        url = reverse("notifications-detail", kwargs={"pk": notification.pk})
-        response = self.client.get(url)
+        monkeypatch.setattr(config, "include_serializer_full_details", True)
+        notification = notification_for(user)
+        request = self.factory.get(NOTIFICATIONS_DETAIL_URL.format(notification.pk))
+        force_authenticate(request, user=user)
+        response = NOTIFICATION_DETAIL_VIEW(request, pk=notification.pk)
         assert response.status_code == 200
@@ -1,5 +1,21 @@
+import sys
+
+from django_notification.tests.constants import PYTHON_VERSION
+
+# Skip the whole suite at collection on unsupported interpreters, so the test
+# modules (and the Django models they import) are never loaded.
+if sys.version_info < PYTHON_VERSION:
+    collect_ignore_glob = ["*/test_*.py"]
+
 from django_notification.tests.setup import configure_django_settings
+
+# Configure Django once per test process (each xdist worker is its own process)
+# before the fixtures below import any models.
+configure_django_settings()
+
 from django_notification.tests.fixtures import (
+    clear_import_cache,
+    session_accounts,
     user_content_type,
     user,
     another_user,
@@ -10,6 +26,7 @@ from django_notification.tests.fixtures import (
     permission,
     notification,
     notification_dict,
+    notification_for,
     notifications,
     notification_recipient,
     notification_seen,
@@ -1,2 +1 @@
 PYTHON_VERSION = (3, 9)
-PYTHON_VERSION_REASON = "Requires Python 3.9 or higher"
@@ -1,14 +1,10 @@
-import sys
-
 import pytest
 from rest_framework.response import Response
 from django_notification.decorators.action import conditional_action
-from django_notification.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
 
 pytestmark = [
     pytest.mark.decorators,
     pytest.mark.decorators_action,
-    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
 ]
 
 
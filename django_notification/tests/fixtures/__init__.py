@@ -1,12 +1,15 @@
+from .module_loading import clear_import_cache
 from .notification import (
     notification,
     notification_dict,
+    notification_for,
     notifications,
     notification_seen,
     notification_recipient,
     deleted_notification,
 )
 from .user import (
+    session_accounts,
     admin_user,
     qs_user,
     group,
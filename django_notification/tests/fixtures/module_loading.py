@@ -0,0 +1,22 @@
+from typing import Iterator
+
+import pytest
+
+from django_notification.utils.module_loading import import_optional_class
+
+
+@pytest.fixture
+def clear_import_cache() -> Iterator[None]:
+    """
+    Fixture to clear the cached class imports around a test.
+
+    `import_optional_class` caches every path it resolves, including failed
+    imports, so results are cleared before and after the test to keep them from
+    leaking between tests.
+
+    Yields:
+        None
+    """
+    import_optional_class.cache_clear()
+    yield
+    import_optional_class.cache_clear()
@@ -12,7 +12,7 @@ from django_notification.models import (
 from django_notification.models.helper.enums.status_choices import NotificationStatus
 
 
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, Tuple
 
 
 @pytest.fixture
@@ -104,9 +104,50 @@ def notification(db, user_content_type: ContentType, user: User) -> Notification
 
 
 @pytest.fixture
-def notifications(db, user: User, qs_user: User, qs_group: Group) -> List[Notification]:
+def notification_for(db, user_content_type: ContentType) -> Callable[..., Notification]:
     """
-    Fixture to create and return a list of multiple Notification instances for testing.
+    Factory fixture to create a Notification already delivered to a given user.
+
+    The recipient row (and the seen row, when requested) is inserted with a single
+    ``bulk_create`` on the through model instead of ``recipient.add()``/``seen_by.add()``.
+
+    Args:
+        db: The database fixture.
+        user_content_type (ContentType): The content type of the user acting as the actor.
+
+    Returns:
+        Callable[..., Notification]: A factory accepting ``user`` and an optional ``seen``
+                                     flag, returning the created Notification instance.
+    """
+
+    def _make(user: User, seen: bool = False) -> Notification:
+        notification = Notification.objects.create(
+            verb="liked",
+            actor_content_type=user_content_type,
+            actor_object_id=user.id,
+            description="User liked a post",
+            status=NotificationStatus.INFO,
+            timestamp=now(),
+            is_sent=True,
+        )
+        NotificationRecipient.objects.bulk_create(
+            [NotificationRecipient(notification=notification, recipient=user)]
+        )
+        if seen:
+            NotificationSeen.objects.bulk_create(
+                [NotificationSeen(notification=notification, user=user, seen_at=now())]
+            )
+        return notification
+
+    return _make
+
+
+@pytest.fixture
+def notifications(
+    db, user: User, qs_user: User, qs_group: Group
+) -> Tuple[Notification, ...]:
+    """
+    Fixture to create and return a tuple of multiple Notification instances for testing.
 
     Args:
         db: The database fixture.
@@ -115,7 +156,9 @@ def notifications(db, user: User, qs_user: User, qs_group: Group) -> List[Notifi
         qs_group (Group): A group to be added to the notifications.
 
     Returns:
-        List[Notification]: A list of created Notification instances.
+        Tuple[Notification, ...]: The created Notification instances, in creation order,
+                                  with their content types, recipients, groups and
+                                  seen_by preloaded.
     """
     notifications = [
         Notification(
@@ -146,18 +189,32 @@ def notifications(db, user: User, qs_user: User, qs_group: Group) -> List[Notifi
             timestamp=now(),
         ),
     ]
-    for notification in notifications:
-        notification.save()
-
-    notifications[0].recipient.add(qs_user)
-    notifications[1].recipient.add(qs_user)
-    notifications[2].recipient.add(qs_user)
-
-    notifications[0].group.add(qs_group)
-    notifications[1].group.add(qs_group)
-    notifications[2].group.add(qs_group)
+    # Descriptions are set explicitly, so skipping ``save()`` loses nothing.
+    Notification.objects.bulk_create(notifications)
+
+    NotificationRecipient.objects.bulk_create(
+        [
+            NotificationRecipient(notification=notification, recipient=qs_user)
+            for notification in notifications
+        ]
+    )
+    GroupThrough = Notification.group.through
+    GroupThrough.objects.bulk_create(
+        [
+            GroupThrough(notification_id=notification.pk, group_id=qs_group.pk)
+            for notification in notifications
+        ]
+    )
 
-    return notifications
+    # Reload with the relations cached so tests can walk them without N+1 queries.
+    return tuple(
+        Notification.objects.filter(pk__in=[n.pk for n in notifications])
+        .select_related(
+            "actor_content_type", "target_content_type", "action_object_content_type"
+        )
+        .prefetch_related("recipient", "group", "seen_by")
+        .order_by("pk")
+    )
 
 
 @pytest.fixture
@@ -1,95 +1,135 @@
+from typing import Dict
+
 import pytest
 from django.contrib.auth.models import User, Group, ContentType, Permission
 
 
+@pytest.fixture(scope="session")
+def session_accounts(django_db_setup, django_db_blocker) -> Dict[str, int]:
+    """
+    Fixture to create the shared users and groups once per test session.
+
+    The rows are committed outside the per-test transactions, so every test
+    sees them while the changes a test makes are still rolled back afterwards.
+
+    Args:
+        django_db_setup: The fixture that creates the test database.
+        django_db_blocker: The fixture used to allow database access at session scope.
+
+    Returns:
+        Dict[str, int]: The primary keys of the created objects, keyed by fixture name.
+    """
+    with django_db_blocker.unblock():
+        return {
+            "user": User.objects.create_user(
+                username="testuser", password="12345", email="testuser@example.com"
+            ).pk,
+            "qs_user": User.objects.create_user(
+                username="queryset_user",
+                password="12345",
+                email="queryset_user@example.com",
+            ).pk,
+            "admin_user": User.objects.create_superuser(
+                username="admin", password="password"
+            ).pk,
+            "another_user": User.objects.create_user(
+                username="anotheruser",
+                password="54321",
+                email="anotheruser@example.com",
+            ).pk,
+            "group": Group.objects.create(name="testgroup").pk,
+            "qs_group": Group.objects.create(name="queryset_group").pk,
+        }
+
+
 @pytest.fixture
-def user(db) -> User:
+def user(db, session_accounts: Dict[str, int]) -> User:
     """
-    Fixture to create a standard User instance for testing.
+    Fixture to provide a standard User instance for testing.
 
     Args:
         db: The database fixture to set up the test database.
+        session_accounts (Dict[str, int]): Primary keys of the session-wide accounts.
 
     Returns:
-        User: The created User instance with username "testuser".
+        User: A fresh copy of the User instance with username "testuser".
     """
-    return User.objects.create_user(
-        username="testuser", password="12345", email="testuser@example.com"
-    )
+    return User.objects.get(pk=session_accounts["user"])
 
 
 @pytest.fixture
-def qs_user(db) -> User:
+def qs_user(db, session_accounts: Dict[str, int]) -> User:
     """
-    Fixture to create a secondary User instance for testing.
+    Fixture to provide a secondary User instance for testing.
 
     Args:
         db: The database fixture to set up the test database.
+        session_accounts (Dict[str, int]): Primary keys of the session-wide accounts.
 
     Returns:
-        User: The created User instance with username "queryset_user".
+        User: A fresh copy of the User instance with username "queryset_user".
     """
-    return User.objects.create_user(
-        username="queryset_user", password="12345", email="queryset_user@example.com"
-    )
+    return User.objects.get(pk=session_accounts["qs_user"])
 
 
 @pytest.fixture
-def admin_user(db) -> User:
+def admin_user(db, session_accounts: Dict[str, int]) -> User:
     """
-    Fixture to create a superuser with admin access for testing.
+    Fixture to provide a superuser with admin access for testing.
 
     Args:
         db: The database fixture to set up the test database.
+        session_accounts (Dict[str, int]): Primary keys of the session-wide accounts.
 
     Returns:
-        User: The created superuser with username "admin".
+        User: A fresh copy of the superuser with username "admin".
     """
-    return User.objects.create_superuser(username="admin", password="password")
+    return User.objects.get(pk=session_accounts["admin_user"])
 
 
 @pytest.fixture
-def another_user(db) -> User:
+def another_user(db, session_accounts: Dict[str, int]) -> User:
     """
-    Fixture to create another User instance for testing.
+    Fixture to provide another User instance for testing.
 
     Args:
         db: The database fixture to set up the test database.
+        session_accounts (Dict[str, int]): Primary keys of the session-wide accounts.
 
     Returns:
-        User: The created User instance with username "anotheruser".
+        User: A fresh copy of the User instance with username "anotheruser".
     """
-    return User.objects.create_user(
-        username="anotheruser", password="54321", email="anotheruser@example.com"
-    )
+    return User.objects.get(pk=session_accounts["another_user"])
 
 
 @pytest.fixture
-def group(db) -> Group:
+def group(db, session_accounts: Dict[str, int]) -> Group:
     """
-    Fixture to create a Group instance for testing.
+    Fixture to provide a Group instance for testing.
 
     Args:
         db: The database fixture to set up the test database.
+        session_accounts (Dict[str, int]): Primary keys of the session-wide accounts.
 
     Returns:
-        Group: The created Group instance with name "testgroup".
+        Group: A fresh copy of the Group instance with name "testgroup".
     """
-    return Group.objects.create(name="testgroup")
+    return Group.objects.get(pk=session_accounts["group"])
 
 
 @pytest.fixture
-def qs_group(db) -> Group:
+def qs_group(db, session_accounts: Dict[str, int]) -> Group:
     """
-    Fixture to create a secondary Group instance for testing.
+    Fixture to provide a secondary Group instance for testing.
 
     Args:
         db: The database fixture to set up the test database.
+        session_accounts (Dict[str, int]): Primary keys of the session-wide accounts.
 
     Returns:
-        Group: The created Group instance with name "queryset_group".
+        Group: A fresh copy of the Group instance with name "queryset_group".
     """
-    return Group.objects.create(name="queryset_group")
+    return Group.objects.get(pk=session_accounts["qs_group"])
 
 
 @pytest.fixture
@@ -122,15 +162,20 @@ def group_with_perm(permission: Permission) -> Group:
     return group
 
 
-@pytest.fixture
-def user_content_type(db) -> ContentType:
+@pytest.fixture(scope="session")
+def user_content_type(django_db_setup, django_db_blocker) -> ContentType:
     """
-    Fixture to retrieve the ContentType for the User model.
+    Fixture to retrieve the ContentType for the User model once per test session.
+
+    Content types are never modified by the tests, so the instance is shared and
+    later ``get_for_model`` lookups are served from the manager's cache.
 
     Args:
-        db: The database fixture to set up the test database.
+        django_db_setup: The fixture that creates the test database.
+        django_db_blocker: The fixture used to allow database access at session scope.
 
     Returns:
         ContentType: The ContentType instance for the User model.
     """
-    return ContentType.objects.get_for_model(User)
+    with django_db_blocker.unblock():
+        return ContentType.objects.get_for_model(User)
@@ -0,0 +1,30 @@
+import pytest
+from django.core.management import call_command
+
+pytestmark = [
+    pytest.mark.models,
+    pytest.mark.models_migrations,
+]
+
+
+@pytest.mark.django_db
+class TestMigrations:
+    """
+    Test suite for the migrations shipped with `django_notification`.
+    """
+
+    def test_no_missing_migrations(self) -> None:
+        """
+        Test that the models have no changes missing from the shipped migrations.
+
+        Asserts:
+        -------
+            - `makemigrations --check` exits without detecting any changes.
+        """
+        call_command(
+            "makemigrations",
+            "django_notification",
+            "--check",
+            "--dry-run",
+            verbosity=0,
+        )
@@ -1,20 +1,17 @@
-import sys
 import pytest
 from django.contrib.auth.models import Group, User
 from django.contrib.contenttypes.models import ContentType
 
-from django_notification.models import Notification
+from django_notification.models import Notification, NotificationRecipient
 from django_notification.models.helper.enums.status_choices import NotificationStatus
-from django_notification.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
 
 pytestmark = [
     pytest.mark.models,
     pytest.mark.models_notification,
-    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
 ]
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(reset_sequences=False, serialized_rollback=False)
 class TestNotification:
     """
     Test suite for the `Notification` model, covering its fields, methods, and string representation.
@@ -39,68 +36,52 @@ class TestNotification:
         assert notification.recipient.count() == 0
         assert notification.group.count() == 0
 
-    def test_title_generator_with_target_and_action_object(
-        self, notification: Notification, user_content_type: ContentType, user: User
+    @pytest.mark.parametrize(
+        "set_target, set_action_object, expected_template",
+        [
+            (True, True, "{user} liked {user} on {user}"),
+            (False, True, "{user} liked {user}"),
+            (True, False, "{user} liked {user}"),
+            (False, False, "{user} liked"),
+        ],
+        ids=[
+            "target_and_action_object",
+            "action_object_without_target",
+            "only_target",
+            "no_target_or_action_object",
+        ],
+    )
+    def test_title_generator(
+        self,
+        notification: Notification,
+        user_content_type: ContentType,
+        user: User,
+        set_target: bool,
+        set_action_object: bool,
+        expected_template: str,
     ) -> None:
         """
-        Test the title generator when both a target and an action object are present.
+        Test the title generator for each combination of target and action object.
 
-        Asserts:
-        -------
-            - The generated title matches the expected format when both target and action object are set.
-        """
-        notification.target_content_type = user_content_type
-        notification.target_object_id = user.id
-        notification.action_object_content_type = user_content_type
-        notification.action_object_object_id = user.id
-        title = notification._title_generator()
-
-        assert title == f"{user} liked {user} on {user}"
-
-    def test_title_generator_action_object_without_target(
-        self, notification: Notification, user_content_type: ContentType, user: User
-    ) -> None:
-        """
-        Test the title generator when there is an action object but no target.
-
-        Asserts:
-        -------
-            - The generated title matches the expected format when only an action object is set.
-        """
-        notification.action_object_content_type = user_content_type
-        notification.action_object_object_id = user.id
-        title = notification._title_generator()
-
-        assert title == f"{user} liked {user}"
-
-    def test_title_generator_with_only_target(
-        self, notification: Notification, user_content_type: ContentType, user: User
-    ) -> None:
-        """
-        Test the title generator when only a target is present.
+        Args:
+        ----
+            set_target (bool): Whether the notification gets a target.
+            set_action_object (bool): Whether the notification gets an action object.
+            expected_template (str): The expected title, formatted with the user.
 
         Asserts:
         -------
-            - The generated title matches the expected format when only a target is set.
-        """
-        notification.target_content_type = user_content_type
-        notification.target_object_id = user.id
-        title = notification._title_generator()
-
-        assert title == f"{user} liked {user}"
-
-    def test_title_generator_with_no_target_or_action_object(
-        self, notification: Notification, user: User
-    ) -> None:
+            - The generated title matches the expected format for the given combination.
         """
-        Test the title generator when neither target nor action object are present.
+        if set_target:
+            notification.target_content_type = user_content_type
+            notification.target_object_id = user.id
+        if set_action_object:
+            notification.action_object_content_type = user_content_type
+            notification.action_object_object_id = user.id
 
-        Asserts:
-        -------
-            - The generated title matches the expected format when neither target nor action object is set.
-        """
         title = notification._title_generator()
-        assert title == f"{user} liked"
+        assert title == expected_template.format(user=user)
 
     def test_mark_as_seen(self, notification: Notification, user: User) -> None:
         """
@@ -110,7 +91,7 @@ class TestNotification:
         -------
             - The recipient is correctly marked as having seen the notification.
         """
-        notification.recipient.add(user)
+        NotificationRecipient.objects.create(notification=notification, recipient=user)
         notification.mark_as_seen(user)
 
         assert notification.seen_by.filter(id=user.id).exists()
@@ -126,7 +107,9 @@ class TestNotification:
             - The recipient user is correctly marked as having seen the notification through their group.
         """
         user.groups.add(group)
-        notification.group.add(group)
+        Notification.group.through.objects.create(
+            notification=notification, group=group
+        )
         notification.mark_as_seen(user)
 
         assert notification.seen_by.filter(id=user.id).exists()
@@ -185,10 +168,10 @@ class TestNotification:
 
         Asserts:
         -------
-            - The `data` field stores and retrieves JSON data correctly.
+            - The `data` field round-trips JSON data through the database correctly.
         """
-        notification.data = {"key": "value"}
-        notification.save()
+        Notification.objects.filter(pk=notification.pk).update(data={"key": "value"})
+        notification.refresh_from_db(fields=["data"])
 
         assert notification.data == {"key": "value"}
 
@@ -1,18 +1,15 @@
-import sys
 import pytest
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from django.contrib.auth.models import User
 from django_notification.models import NotificationRecipient, Notification
-from django_notification.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
 
 pytestmark = [
     pytest.mark.models,
     pytest.mark.models_notification_recipient,
-    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
 ]
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(reset_sequences=False, serialized_rollback=False)
 class TestNotificationRecipient:
     """
     Test suite for the `NotificationRecipient` model.
@@ -47,7 +44,10 @@ class TestNotificationRecipient:
         NotificationRecipient.objects.create(notification=notification, recipient=user)
 
         # Try to create a second NotificationRecipient instance with the same recipient and notification
-        with pytest.raises(IntegrityError, match="UNIQUE constraint failed"):
+        # inside a savepoint, so only that INSERT is rolled back
+        with pytest.raises(
+            IntegrityError, match="UNIQUE constraint failed"
+        ), transaction.atomic():
             NotificationRecipient.objects.create(
                 notification=notification, recipient=user
             )
@@ -1,33 +1,30 @@
-import sys
-from typing import List
+from typing import List, Tuple
 
 import pytest
 from django.contrib.auth.models import User, Group
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from django_notification.models import Notification, DeletedNotification
-from django_notification.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
 
-pytestmark = [
-    pytest.mark.managers,
-    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
-]
+pytestmark = [pytest.mark.managers]
 
 
-@pytest.mark.django_db
+@pytest.mark.django_db(reset_sequences=False, serialized_rollback=False)
 class TestNotificationQuerySet:
     """
     Test suite for the `NotificationDataAccessLayer`.
     """
 
     def test_all_notifications_with_recipients(
-        self, notifications: List[Notification], qs_user: List[User]
+        self, notifications: Tuple[Notification, ...], qs_user: List[User]
     ) -> None:
         """
         Test that `all_notifications` filters notifications by recipients.
 
         Args:
         ----
-            notifications (List[Notification]): List of notification instances for testing.
+            notifications (Tuple[Notification, ...]): The notification instances for testing.
             qs_user (List[User]): List of user instances to filter notifications by.
 
         Asserts:
@@ -39,14 +36,14 @@ class TestNotificationQuerySet:
         assert queryset.count() == len(notifications)
 
     def test_all_notifications_with_groups(
-        self, notifications: List[Notification], qs_group: List[Group]
+        self, notifications: Tuple[Notification, ...], qs_group: List[Group]
     ) -> None:
         """
         Test that `all_notifications` filters notifications by groups.
 
         Args:
         ----
-            notifications (List[Notification]): List of notification instances for testing.
+            notifications (Tuple[Notification, ...]): The notification instances for testing.
             qs_group (List[Group]): List of group instances to filter notifications by.
 
         Asserts:
@@ -59,7 +56,7 @@ class TestNotificationQuerySet:
 
     def test_all_notifications_with_recipients_and_groups(
         self,
-        notifications: List[Notification],
+        notifications: Tuple[Notification, ...],
         qs_user: List[User],
         qs_group: List[Group],
     ) -> None:
@@ -68,7 +65,7 @@ class TestNotificationQuerySet:
 
         Args:
         ----
-            notifications (List[Notification]): List of notification instances for testing.
+            notifications (Tuple[Notification, ...]): The notification instances for testing.
             qs_user (List[User]): List of user instances to filter notifications by.
             qs_group (List[Group]): List of group instances to filter notifications by.
 
@@ -83,14 +80,14 @@ class TestNotificationQuerySet:
         assert queryset.count() == len(notifications)
 
     def test_sent_with_groups(
-        self, notifications: List[Notification], qs_group: List[Group]
+        self, notifications: Tuple[Notification, ...], qs_group: List[Group]
     ) -> None:
         """
         Test that `sent` filters notifications by groups.
 
         Args:
         ----
-            notifications (List[Notification]): List of notification instances for testing.
+            notifications (Tuple[Notification, ...]): The notification instances for testing.
             qs_group (List[Group]): List of group instances to filter sent notifications by.
 
         Asserts:
@@ -101,13 +98,13 @@ class TestNotificationQuerySet:
         queryset = Notification.objects.sent(groups=qs_group)
         assert queryset.count() == len([n for n in notifications if n.is_sent])
 
-    def test_unsent(self, notifications: List[Notification]) -> None:
+    def test_unsent(self, notifications: Tuple[Notification, ...]) -> None:
         """
         Test that `unsent` filters only unsent notifications.
 
         Args:
         ----
-            notifications (List[Notification]): List of notification instances for testing.
+            notifications (Tuple[Notification, ...]): The notification instances for testing.
 
         Asserts:
         -------
@@ -119,7 +116,7 @@ class TestNotificationQuerySet:
 
     def test_unsent_with_recipients_and_groups(
         self,
-        notifications: List[Notification],
+        notifications: Tuple[Notification, ...],
         qs_user: List[User],
         qs_group: List[Group],
     ) -> None:
@@ -128,7 +125,7 @@ class TestNotificationQuerySet:
 
         Args:
         ----
-            notifications (List[Notification]): List of notification instances for testing.
+            notifications (Tuple[Notification, ...]): The notification instances for testing.
             qs_user (List[User]): List of user instances to filter unsent notifications by.
             qs_group (List[Group]): List of group instances to filter unsent notifications by.
 
@@ -141,14 +138,14 @@ class TestNotificationQuerySet:
         assert queryset.count() == len([n for n in notifications if not n.is_sent])
 
     def test_unsent_exclude_deleted(
-        self, notifications: List[Notification], qs_user: List[User]
+        self, notifications: Tuple[Notification, ...], qs_user: List[User]
     ) -> None:
         """
         Test that `unsent` excludes notifications that have been soft deleted.
 
         Args:
         ----
-            notifications (List[Notification]): List of notification instances for testing.
+            notifications (Tuple[Notification, ...]): The notification instances for testing.
             qs_user (List[User]): List of user instances to exclude deleted notifications by.
 
         Asserts:
@@ -159,30 +156,34 @@ class TestNotificationQuerySet:
         queryset = Notification.objects.unsent(exclude_deleted_by=qs_user)
         assert queryset.count() > 0
 
-    def test_mark_as_sent(self, notifications: List[Notification]) -> None:
+    def test_mark_as_sent(self, notifications: Tuple[Notification, ...]) -> None:
         """
         Test that `mark_as_sent` is called for all notifications.
 
         Args:
         ----
-            notifications (List[Notification]): List of notification instances for testing.
+            notifications (Tuple[Notification, ...]): The notification instances for testing.
 
         Asserts:
         -------
-            The `mark_as_sent` method is successfully called. (Placeholder assertion)
+            All unsent notifications are marked as sent with a single UPDATE query.
         """
-        Notification.objects.mark_all_as_sent()
-        assert True
+        with CaptureQueriesContext(connection) as ctx:
+            updated = Notification.objects.mark_all_as_sent()
+
+        assert updated == len([n for n in notifications if not n.is_sent])
+        assert len(ctx.captured_queries) == 1
+        assert ctx.captured_queries[0]["sql"].upper().startswith("UPDATE")
 
     def test_deleted(
-        self, notifications: List[Notification], qs_user: List[User]
+        self, notifications: Tuple[Notification, ...], qs_user: List[User]
     ) -> None:
         """
         Test that `deleted` returns notifications that have been marked as deleted.
 
         Args:
         ----
-            notifications (List[Notification]): List of notification instances for testing.
+            notifications (Tuple[Notification, ...]): The notification instances for testing.
             qs_user (List[User]): List of user instances to filter deleted notifications by.
 
         Asserts:
@@ -219,65 +220,65 @@ class TestNotificationQuerySet:
         assert notification.group.count() == 1
         assert notification.group.first() == qs_group
 
-    def test_update_notification(self, notifications: List[Notification]) -> None:
+    def test_update_notification(self, notifications: Tuple[Notification, ...]) -> None:
         """
         Test that `update_notification` correctly updates the notification attributes.
 
         Args:
         ----
-            notifications (List[Notification]): List of notification instances for testing.
+            notifications (Tuple[Notification, ...]): The notification instances for testing.
 
         Asserts:
         -------
             The updated notification should have the new attributes applied.
         """
-        notification = notifications[1]
+        _, notification, _ = notifications
         updated_notification = Notification.objects.update_notification(
             notification_id=notification.id,
             is_sent=True,
             public=False,
-            data={"key": "value"}
+            data={"key": "value"},
         )
         assert updated_notification.is_sent is True
         assert updated_notification.public is False
         assert updated_notification.data is not None
 
     def test_delete_notification_without_recipient(
-        self, notifications: List[Notification]
+        self, notifications: Tuple[Notification, ...]
     ) -> None:
         """
         Test that `delete_notification` raises a ValueError if no recipient is provided for a soft delete.
 
         Args:
         ----
-            notifications (List[Notification]): List of notification instances for testing.
+            notifications (Tuple[Notification, ...]): The notification instances for testing.
 
         Asserts:
         -------
             A ValueError should be raised if no recipient is provided for the delete operation.
         """
-        notification = notifications[0]
+        notification, _, _ = notifications
         with pytest.raises(ValueError):
             Notification.objects.delete_notification(
                 notification_id=notification.id, recipient=None, soft_delete=True
             )
 
     def test_delete_notification_with_recipient(
-        self, notifications: List[Notification], qs_user: List[User]
+        self, notifications: Tuple[Notification, ...], qs_user: List[User]
     ) -> None:
         """
         Test that `delete_notification` correctly handles soft delete with a recipient.
 
         Args:
         ----
-            notifications (List[Notification]): List of notification instances for testing.
+            notifications (Tuple[Notification, ...]): The notification instances for testing.
             qs_user (List[User]): List of user instances to be used for the soft delete operation.
 
         Asserts:
         -------
             The deleted notification should exist in the DeletedNotification model.
         """
-        notification = notifications[2]
+        _, _, notification = notifications
         Notification.objects.delete_notification(
             notification_id=notification.id, recipient=qs_user, soft_delete=True
         )
@@ -1,269 +1,156 @@
-import sys
+from types import SimpleNamespace
+from typing import Any, Dict, List
 
 import pytest
-from unittest.mock import patch, MagicMock
 from django_notification.settings.checks import check_notification_settings
-from django_notification.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
 
 pytestmark = [
     pytest.mark.settings,
     pytest.mark.settings_checks,
-    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
 ]
 
+PREFIX = "DJANGO_NOTIFICATION_"
+
+
+@pytest.fixture(scope="module")
+def valid_cfg() -> SimpleNamespace:
+    """
+    Build a plain configuration object holding valid values for every checked setting.
+
+    Returns:
+    -------
+        SimpleNamespace: The shared valid configuration. Tests copy it instead of mutating it.
+    """
+    return SimpleNamespace(
+        prefix=PREFIX,
+        include_soft_delete=True,
+        include_hard_delete=False,
+        admin_has_add_permission=False,
+        admin_has_change_permission=False,
+        admin_has_delete_permission=False,
+        include_serializer_full_details=True,
+        exclude_serializer_null_fields=True,
+        api_allow_list=True,
+        api_allow_retrieve=False,
+        user_serializer_fields=["id", "username"],
+        api_ordering_fields=["created_at"],
+        api_search_fields=["title"],
+        staff_user_throttle_rate="10/minute",
+        authenticated_user_throttle_rate="5/minute",
+        get_setting=lambda name, default: None,
+    )
 
-class TestCheckNotificationSettings:
-    @patch("django_notification.settings.checks.config")
-    def test_valid_settings(self, mock_config: MagicMock) -> None:
-        """
-        Test that valid settings produce no errors.
-
-        Args:
-        ----
-            mock_config (MagicMock): Mocked configuration object with valid settings.
-
-        Asserts:
-        -------
-            No errors are returned when all settings are valid.
-        """
-        # Mock the config values to be valid
-        mock_config.include_soft_delete = True
-        mock_config.include_hard_delete = False
-        mock_config.admin_has_add_permission = False
-        mock_config.admin_has_change_permission = False
-        mock_config.admin_has_delete_permission = False
-        mock_config.include_serializer_full_details = True
-        mock_config.exclude_serializer_null_fields = True
-        mock_config.api_allow_list = True
-        mock_config.api_allow_retrieve = False
-        mock_config.user_serializer_fields = ["id", "username"]
-        mock_config.api_ordering_fields = ["created_at"]
-        mock_config.api_search_fields = ["title"]
-        mock_config.staff_user_throttle_rate = "10/minute"
-        mock_config.authenticated_user_throttle_rate = "5/minute"
-        mock_config.get_setting.side_effect = lambda name, default: None
-
-        errors = check_notification_settings(None)
-
-        # There should be no errors for valid settings
-        assert not errors
-
-    @patch("django_notification.settings.checks.config")
-    def test_invalid_boolean_settings(self, mock_config: MagicMock) -> None:
-        """
-        Test that invalid boolean settings return errors.
-
-        Args:
-        ----
-            mock_config (MagicMock): Mocked configuration object with invalid boolean settings.
-
-        Asserts:
-        -------
-            Three errors are returned for invalid boolean values in settings.
-        """
-        # Mock the config values with invalid boolean settings
-        mock_config.include_soft_delete = "not_boolean"
-        mock_config.include_hard_delete = "not_boolean"
-        mock_config.admin_has_add_permission = "not_boolean"
-        mock_config.admin_has_change_permission = "not_boolean"
-        mock_config.admin_has_delete_permission = "not_boolean"
-        mock_config.include_serializer_full_details = "not_bool"
-        mock_config.exclude_serializer_null_fields = "not_boolean"
-        mock_config.user_serializer_fields = ["id", "username"]
-        mock_config.api_ordering_fields = ["created_at"]
-        mock_config.api_search_fields = ["title"]
-        mock_config.staff_user_throttle_rate = "10/minute"
-        mock_config.authenticated_user_throttle_rate = "5/minute"
-        mock_config.api_allow_list = "not_boolean"
-        mock_config.api_allow_retrieve = True
-        mock_config.get_setting.side_effect = lambda name, default: None
 
-        errors = check_notification_settings(None)
-
-        # Expect 8 errors for invalid boolean values
-        assert len(errors) == 8
-        assert (
-            errors[0].id
-            == f"django_notification.E001_{mock_config.prefix}API_INCLUDE_SOFT_DELETE"
-        )
-        assert (
-            errors[1].id
-            == f"django_notification.E001_{mock_config.prefix}API_INCLUDE_HARD_DELETE"
-        )
-        assert (
-            errors[2].id
-            == f"django_notification.E001_{mock_config.prefix}ADMIN_HAS_ADD_PERMISSION"
-        )
-        assert (
-            errors[3].id
-            == f"django_notification.E001_{mock_config.prefix}ADMIN_HAS_CHANGE_PERMISSION"
-        )
-        assert (
-            errors[4].id
-            == f"django_notification.E001_{mock_config.prefix}ADMIN_HAS_DELETE_PERMISSION"
-        )
-        assert (
-                errors[5].id
-                == f"django_notification.E001_{mock_config.prefix}SERIALIZER_INCLUDE_FULL_DETAILS"
-        )
-        assert (
-                errors[6].id
-                == f"django_notification.E001_{mock_config.prefix}SERIALIZER_EXCLUDE_NULL_FIELDS"
-        )
-        assert (
-            errors[7].id
-            == f"django_notification.E001_{mock_config.prefix}API_ALLOW_LIST"
-        )
-
-    @patch("django_notification.settings.checks.config")
-    def test_invalid_list_settings(self, mock_config: MagicMock) -> None:
-        """
-        Test that invalid list settings return errors.
-
-        Args:
-        ----
-            mock_config (MagicMock): Mocked configuration object with invalid list settings.
-
-        Asserts:
-        -------
-            Three errors are returned for invalid list values in settings.
-        """
-        # Mock the config values with invalid list settings
-        mock_config.include_soft_delete = True
-        mock_config.include_hard_delete = False
-        mock_config.admin_has_add_permission = False
-        mock_config.admin_has_change_permission = False
-        mock_config.admin_has_delete_permission = False
-        mock_config.include_serializer_full_details = True
-        mock_config.exclude_serializer_null_fields = True
-        mock_config.api_allow_list = True
-        mock_config.api_allow_retrieve = False
-        mock_config.user_serializer_fields = []
-        mock_config.api_ordering_fields = []
-        mock_config.staff_user_throttle_rate = "10/minute"
-        mock_config.authenticated_user_throttle_rate = "5/minute"
-        mock_config.get_setting.side_effect = lambda name, default: None
-        mock_config.api_search_fields = [123]  # Invalid list element
-
-        errors = check_notification_settings(None)
-
-        # Expect 3 errors for invalid list settings
-        assert len(errors) == 3
-        assert (
-            errors[0].id
-            == f"django_notification.E003_{mock_config.prefix}USER_SERIALIZER_FIELDS"
-        )
-        assert (
-            errors[1].id
-            == f"django_notification.E003_{mock_config.prefix}API_ORDERING_FIELDS"
-        )
-        assert (
-            errors[2].id
-            == f"django_notification.E004_{mock_config.prefix}API_SEARCH_FIELDS"
-        )
-
-    @patch("django_notification.settings.checks.config")
-    def test_invalid_throttle_rate(self, mock_config: MagicMock) -> None:
+class TestCheckNotificationSettings:
+    @pytest.fixture(autouse=True)
+    def _patch_config(
+        self, valid_cfg: SimpleNamespace, monkeypatch: pytest.MonkeyPatch
+    ) -> SimpleNamespace:
         """
-        Test that invalid throttle rates return errors.
+        Patch the config used by the checks with a fresh copy of `valid_cfg`.
 
         Args:
         ----
-            mock_config (MagicMock): Mocked configuration object with invalid throttle rates.
+            valid_cfg (SimpleNamespace): The shared valid configuration.
+            monkeypatch (pytest.MonkeyPatch): Fixture used to patch the checks module.
 
-        Asserts:
+        Returns:
         -------
-            Two errors are returned for invalid throttle rates.
+            SimpleNamespace: The patched configuration, safe for the test to mutate.
         """
-        # Mock the config values with invalid throttle rates
-        mock_config.include_soft_delete = True
-        mock_config.include_hard_delete = False
-        mock_config.admin_has_add_permission = False
-        mock_config.admin_has_change_permission = False
-        mock_config.admin_has_delete_permission = False
-        mock_config.include_serializer_full_details = True
-        mock_config.exclude_serializer_null_fields = True
-        mock_config.api_allow_list = True
-        mock_config.api_allow_retrieve = False
-        mock_config.user_serializer_fields = ["id", "username"]
-        mock_config.api_ordering_fields = ["created_at"]
-        mock_config.api_search_fields = ["title"]
-        mock_config.get_setting.side_effect = lambda name, default: None
-        mock_config.staff_user_throttle_rate = "invalid_rate"
-        mock_config.authenticated_user_throttle_rate = "abc/hour"
-
-        errors = check_notification_settings(None)
-
-        # Expect 2 errors for invalid throttle rates
-        assert len(errors) == 2
-        assert errors[0].id == "django_notification.E005"
-        assert errors[1].id == "django_notification.E007"
-
-    @patch("django_notification.settings.checks.config")
-    def test_invalid_class_import(self, mock_config: MagicMock) -> None:
+        cfg = SimpleNamespace(**vars(valid_cfg))
+        monkeypatch.setattr("django_notification.settings.checks.config", cfg)
+        return cfg
+
+    @pytest.mark.parametrize(
+        "overrides, expected_ids",
+        [
+            ({}, []),
+            (
+                {
+                    "include_soft_delete": "not_boolean",
+                    "include_hard_delete": "not_boolean",
+                    "admin_has_add_permission": "not_boolean",
+                    "admin_has_change_permission": "not_boolean",
+                    "admin_has_delete_permission": "not_boolean",
+                    "include_serializer_full_details": "not_bool",
+                    "exclude_serializer_null_fields": "not_boolean",
+                    "api_allow_list": "not_boolean",
+                    "api_allow_retrieve": True,
+                },
+                [
+                    f"django_notification.E001_{PREFIX}API_INCLUDE_SOFT_DELETE",
+                    f"django_notification.E001_{PREFIX}API_INCLUDE_HARD_DELETE",
+                    f"django_notification.E001_{PREFIX}ADMIN_HAS_ADD_PERMISSION",
+                    f"django_notification.E001_{PREFIX}ADMIN_HAS_CHANGE_PERMISSION",
+                    f"django_notification.E001_{PREFIX}ADMIN_HAS_DELETE_PERMISSION",
+                    f"django_notification.E001_{PREFIX}SERIALIZER_INCLUDE_FULL_DETAILS",
+                    f"django_notification.E001_{PREFIX}SERIALIZER_EXCLUDE_NULL_FIELDS",
+                    f"django_notification.E001_{PREFIX}API_ALLOW_LIST",
+                ],
+            ),
+            (
+                {
+                    "user_serializer_fields": [],
+                    "api_ordering_fields": [],
+                    "api_search_fields": [123],  # Invalid list element
+                },
+                [
+                    f"django_notification.E003_{PREFIX}USER_SERIALIZER_FIELDS",
+                    f"django_notification.E003_{PREFIX}API_ORDERING_FIELDS",
+                    f"django_notification.E004_{PREFIX}API_SEARCH_FIELDS",
+                ],
+            ),
+            (
+                {
+                    "staff_user_throttle_rate": "invalid_rate",
+                    "authenticated_user_throttle_rate": "abc/hour",
+                },
+                ["django_notification.E005", "django_notification.E007"],
+            ),
+            (
+                {"get_setting": lambda name, default: "invalid.path.ClassName"},
+                [
+                    f"django_notification.E010_{PREFIX}USER_SERIALIZER_CLASS",
+                    f"django_notification.E010_{PREFIX}GROUP_SERIALIZER_CLASS",
+                    f"django_notification.E010_{PREFIX}API_THROTTLE_CLASS",
+                    f"django_notification.E010_{PREFIX}API_PAGINATION_CLASS",
+                    f"django_notification.E011_{PREFIX}API_PARSER_CLASSES",
+                    f"django_notification.E010_{PREFIX}API_FILTERSET_CLASS",
+                    f"django_notification.E010_{PREFIX}API_EXTRA_PERMISSION_CLASS",
+                    f"django_notification.E010_{PREFIX}ADMIN_SITE_CLASS",
+                ],
+            ),
+        ],
+        ids=[
+            "valid_settings",
+            "invalid_boolean_settings",
+            "invalid_list_settings",
+            "invalid_throttle_rate",
+            "invalid_class_import",
+        ],
+    )
+    def test_check_notification_settings(
+        self,
+        _patch_config: SimpleNamespace,
+        overrides: Dict[str, Any],
+        expected_ids: List[str],
+    ) -> None:
         """
-        Test that invalid class import settings return errors.
+        Test that each group of invalid settings returns the expected errors, in order.
 
         Args:
         ----
-            mock_config (MagicMock): Mocked configuration object with invalid class paths.
+            _patch_config (SimpleNamespace): The patched configuration with valid settings.
+            overrides (Dict[str, Any]): Settings replaced with invalid values.
+            expected_ids (List[str]): The error IDs the checks should return.
 
         Asserts:
         -------
-            Seven errors are returned for invalid class imports.
+            The returned error IDs match the expected IDs; valid settings return none.
         """
-        # Mock the config values with invalid class paths
-        mock_config.include_soft_delete = True
-        mock_config.include_hard_delete = False
-        mock_config.admin_has_add_permission = False
-        mock_config.admin_has_change_permission = False
-        mock_config.admin_has_delete_permission = False
-        mock_config.include_serializer_full_details = True
-        mock_config.exclude_serializer_null_fields = True
-        mock_config.api_allow_list = True
-        mock_config.api_allow_retrieve = False
-        mock_config.user_serializer_fields = ["id", "username"]
-        mock_config.api_ordering_fields = ["created_at"]
-        mock_config.api_search_fields = ["title"]
-        mock_config.staff_user_throttle_rate = "10/minute"
-        mock_config.authenticated_user_throttle_rate = "5/minute"
-        mock_config.get_setting.side_effect = (
-            lambda name, default: "invalid.path.ClassName"
-        )
+        vars(_patch_config).update(overrides)
 
         errors = check_notification_settings(None)
 
-        # Expect 8 errors for invalid class imports
-        assert len(errors) == 8
-        assert (
-            errors[0].id
-            == f"django_notification.E010_{mock_config.prefix}USER_SERIALIZER_CLASS"
-        )
-        assert (
-            errors[1].id
-            == f"django_notification.E010_{mock_config.prefix}GROUP_SERIALIZER_CLASS"
-        )
-        assert (
-            errors[2].id
-            == f"django_notification.E010_{mock_config.prefix}API_THROTTLE_CLASS"
-        )
-        assert (
-            errors[3].id
-            == f"django_notification.E010_{mock_config.prefix}API_PAGINATION_CLASS"
-        )
-        assert (
-            errors[4].id
-            == f"django_notification.E011_{mock_config.prefix}API_PARSER_CLASSES"
-        )
-        assert (
-            errors[5].id
-            == f"django_notification.E010_{mock_config.prefix}API_FILTERSET_CLASS"
-        )
-        assert (
-            errors[6].id
-            == f"django_notification.E010_{mock_config.prefix}API_EXTRA_PERMISSION_CLASS"
-        )
-        assert (
-                errors[7].id
-                == f"django_notification.E010_{mock_config.prefix}ADMIN_SITE_CLASS"
-        )
+        assert [error.id for error in errors] == expected_ids
@@ -1,14 +1,11 @@
-import sys
-
 import pytest
 from unittest.mock import patch
 from django_notification.settings.conf import NotificationConfig
-from django_notification.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
 
 pytestmark = [
     pytest.mark.settings,
     pytest.mark.settings_conf,
-    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+    pytest.mark.usefixtures("clear_import_cache"),
 ]
 
 
@@ -58,3 +55,34 @@ class TestNotificationConfig:
 
         result = config.get_optional_classes("INVALID_SETTING", ["INVALID_PATH"])
         assert not result
+
+    def test_import_results_are_cached(self) -> None:
+        """
+        Test that `get_optional_classes` imports a given path only once, including failed imports.
+
+        Args:
+        ----
+            None
+
+        Asserts:
+        -------
+            `import_string` is called once per distinct path across repeated lookups.
+            Cached failures still resolve to None for single paths and [] for lists.
+        """
+        config = NotificationConfig()
+
+        with patch(
+            "django_notification.utils.module_loading.import_string",
+            side_effect=ImportError,
+        ) as mock_import_string:
+            for _ in range(3):
+                assert (
+                    config.get_optional_classes("INVALID_SETTING", "invalid.path.A")
+                    is None
+                )
+                assert (
+                    config.get_optional_classes("INVALID_SETTING", ["invalid.path.A"])
+                    == []
+                )
+
+        assert mock_import_string.call_count == 1
@@ -0,0 +1,71 @@
+import pytest
+
+from django_notification.utils.serialization.field_filters import (
+    filter_non_empty_fields,
+)
+
+pytestmark = [
+    pytest.mark.utils,
+    pytest.mark.utils_field_filters,
+]
+
+
+class TestFilterNonEmptyFields:
+    """
+    Test suite for the `filter_non_empty_fields` utility.
+    """
+
+    def test_empty_values_are_removed(self) -> None:
+        """
+        Test that `filter_non_empty_fields` drops fields whose value is empty.
+
+        Args:
+        ----
+            None
+
+        Asserts:
+        -------
+            Only the fields with non-empty values are kept.
+        """
+        data = {
+            "id": 1,
+            "title": "Hello",
+            "description": None,
+            "link": "",
+            "recipient": [],
+            "data": {},
+        }
+        assert filter_non_empty_fields(data) == {"id": 1, "title": "Hello"}
+
+    def test_falsy_non_empty_values_are_kept(self) -> None:
+        """
+        Test that `filter_non_empty_fields` keeps falsy values that are not empty containers.
+
+        Args:
+        ----
+            None
+
+        Asserts:
+        -------
+            Fields set to 0 or False are kept in the result.
+        """
+        data = {"count": 0, "is_sent": False, "title": ""}
+        assert filter_non_empty_fields(data) == {"count": 0, "is_sent": False}
+
+    def test_excluded_fields_are_removed(self) -> None:
+        """
+        Test that `filter_non_empty_fields` drops the excluded fields.
+
+        Args:
+        ----
+            None
+
+        Asserts:
+        -------
+            Excluded fields are removed even when their values are not empty.
+        """
+        data = {"id": 1, "username": "user", "password": "secret"}
+        assert filter_non_empty_fields(data, exclude_fields=["password"]) == {
+            "id": 1,
+            "username": "user",
+        }
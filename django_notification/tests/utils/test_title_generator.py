@@ -1,62 +1,67 @@
-import sys
-
 import pytest
-from typing import Dict, Any
+from typing import Any, Dict, Tuple
 from django.utils.timezone import now, timedelta
 
 from django_notification.models import Notification
-from django_notification.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
 from django_notification.utils.serialization.notif_title_generator import generate_title
 
 pytestmark = [
     pytest.mark.utils,
     pytest.mark.utils_title_generator,
-    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
 ]
 
 
+@pytest.fixture(scope="session")
+def title_cases() -> Dict[str, Tuple[Dict[str, Any], str]]:
+    """
+    Build the notification dictionaries and expected titles, sharing one `now()` call.
+
+    Returns:
+    -------
+        Dict[str, Tuple[Dict[str, Any], str]]: Each case's notification dictionary and expected title.
+    """
+    current_time = now()
+    return {
+        "description_only": ({"description": "Task completed"}, "Task completed"),
+        "hours_ago": (
+            {
+                "description": "New message",
+                "timestamp": current_time - timedelta(hours=2),
+            },
+            "New message 2 hours ago",
+        ),
+        "days_ago": (
+            {
+                "description": "Appointment reminder",
+                "timestamp": current_time - timedelta(days=1),
+            },
+            "Appointment reminder 1 day ago",
+        ),
+    }
+
+
 class TestGenerateTitle:
     """
     Test suite for the `generate_title` utility.
     """
 
-    @pytest.mark.parametrize(
-        "notification_dict, expected_title",
-        [
-            (
-                {
-                    "description": "Task completed",
-                },
-                "Task completed",
-            ),
-            (
-                {"description": "New message", "timestamp": now() - timedelta(hours=2)},
-                "New message 2 hours ago",
-            ),
-            (
-                {
-                    "description": "Appointment reminder",
-                    "timestamp": now() - timedelta(days=1),
-                },
-                "Appointment reminder 1 day ago",
-            ),
-        ],
-    )
+    @pytest.mark.parametrize("case", ["description_only", "hours_ago", "days_ago"])
     def test_generate_title_with_valid_data(
-        self, notification_dict: Dict[str, Any], expected_title: str
+        self, title_cases: Dict[str, Tuple[Dict[str, Any], str]], case: str
     ) -> None:
         """
         Test that `generate_title` correctly formats the title when provided with valid data.
 
         Args:
         ----
-            notification_dict (Dict[str, Any]): Dictionary containing notification data.
-            expected_title (str): The expected formatted title.
+            title_cases (Dict[str, Tuple[Dict[str, Any], str]]): The shared notification dictionaries and expected titles.
+            case (str): The name of the case to check.
 
         Asserts:
         -------
             The result of `generate_title` should match the expected title when valid data is provided.
         """
+        notification_dict, expected_title = title_cases[case]
         result = generate_title(notification_dict)
         # Normalize the spaces in both expected and actual results
         assert result.replace("\xa0", " ") == expected_title
@@ -1,4 +1,3 @@
-import sys
 from unittest.mock import patch
 from django_notification.validators.config_validators import (
     validate_boolean_setting,
@@ -8,12 +7,11 @@ from django_notification.validators.config_validators import (
     validate_optional_classes_setting,
 )
 import pytest
-from django_notification.tests.constants import PYTHON_VERSION, PYTHON_VERSION_REASON
 
 pytestmark = [
     pytest.mark.validators,
     pytest.mark.config_validators,
-    pytest.mark.skipif(sys.version_info < PYTHON_VERSION, reason=PYTHON_VERSION_REASON),
+    pytest.mark.usefixtures("clear_import_cache"),
 ]
 
 
@@ -114,6 +112,25 @@ class TestValidateListFields:
         assert len(errors) == 1
         assert errors[0].id == "django_notification.E004_SOME_LIST_SETTING"
 
+    def test_multiple_invalid_elements_in_list(self) -> None:
+        """
+        Test that a list with several non-string elements returns a single error.
+
+        Args:
+        ----
+            None
+
+        Asserts:
+        -------
+            The result should contain one error with the expected error ID, naming the first invalid element.
+        """
+        errors = validate_list_fields([None, 123, "valid_field"], "SOME_LIST_SETTING")
+        assert len(errors) == 1
+        assert errors[0].id == "django_notification.E004_SOME_LIST_SETTING"
+        assert (
+            errors[0].msg == "Invalid type in SOME_LIST_SETTING: None is not a string."
+        )
+
 
 class TestValidateThrottleRate:
     def test_valid_throttle_rate(self) -> None:
@@ -183,6 +200,28 @@ class TestValidateThrottleRate:
         assert len(errors) == 1
         assert errors[0].id == "django_notification.E007"
 
+    def test_repeated_validation_returns_fresh_lists(self) -> None:
+        """
+        Test that repeated validation of the same rate gives equal results in separate lists.
+
+        Args:
+        ----
+            None
+
+        Asserts:
+        -------
+            Both calls report the same errors, and mutating one result does not affect the other.
+        """
+        first = validate_throttle_rate("abc/century", "THROTTLE_RATE_SETTING")
+        second = validate_throttle_rate("abc/century", "THROTTLE_RATE_SETTING")
+        assert [error.id for error in first] == [
+            "django_notification.E007",
+            "django_notification.E008",
+        ]
+        assert first == second
+        first.clear()
+        assert len(second) == 2
+
 
 class TestValidateOptionalClassSetting:
     def test_valid_class_import(self) -> None:
@@ -294,3 +333,29 @@ class TestValidateOptionalClassSetting:
             )
             assert len(errors) == 1
             assert errors[0].id == "django_notification.E013_SOME_CLASS_SETTING"
+
+    def test_class_path_imports_are_cached(self) -> None:
+        """
+        Test that each class path is only imported once across repeated validations.
+
+        Args:
+        ----
+            None
+
+        Asserts:
+        -------
+            Failed imports are cached, so the import is attempted a single time.
+        """
+        with patch(
+            "django_notification.utils.module_loading.import_string",
+            side_effect=ImportError,
+        ) as mock_import:
+            for _ in range(3):
+                validate_optional_class_setting(
+                    "invalid.path.ClassName", "SOME_CLASS_SETTING"
+                )
+                errors = validate_optional_classes_setting(
+                    ["invalid.path.ClassName"], "SOME_CLASS_SETTING"
+                )
+            assert errors[0].id == "django_notification.E013_SOME_CLASS_SETTING"
+            assert mock_import.call_count == 1
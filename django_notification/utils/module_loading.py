@@ -0,0 +1,25 @@
+from functools import lru_cache
+from typing import Any, Optional, Tuple, Type
+
+from django.utils.module_loading import import_string
+
+
+@lru_cache(maxsize=64)
+def import_optional_class(class_path: str) -> Tuple[bool, Optional[Type[Any]]]:
+    """Import a class by its dotted path, caching failed imports as well.
+
+    Results are cached per path for the lifetime of the process; call
+    ``import_optional_class.cache_clear()`` to reset the cache.
+
+    Args:
+        class_path (str): The dotted import path of the class.
+
+    Returns:
+        Tuple[bool, Optional[Type[Any]]]: Whether the import succeeded, and the
+         imported class (None if it failed).
+
+    """
+    try:
+        return True, import_string(class_path)
+    except ImportError:
+        return False, None
@@ -12,9 +12,16 @@ def filter_non_empty_fields(data: Dict, exclude_fields: List = None) -> Dict:
         dict: A dictionary containing only non-empty and non-excluded fields.
 
     """
-    exclude_fields = exclude_fields or []
-    return {
-        field_name: field_value
-        for field_name, field_value in data.items()
-        if field_value not in (None, "", [], {}) and field_name not in exclude_fields
-    }
+    excluded = frozenset(exclude_fields) if exclude_fields else frozenset()
+    filtered = {}
+    for field_name, field_value in data.items():
+        if field_name in excluded:
+            continue
+        if field_value is None:
+            continue
+        # Only empty strings, lists and dicts count as empty; 0 and False are kept
+        if isinstance(field_value, (str, list, dict)) and not field_value:
+            continue
+        filtered[field_name] = field_value
+
+    return filtered
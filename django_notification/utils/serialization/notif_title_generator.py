@@ -14,19 +14,19 @@ def generate_title(notification: Dict[str, Any]) -> str:
         str: The title of the notification, including its description and the time since the timestamp.
 
     """
-    try:
-        description = notification.get("description")
-        if description:
-            timestamp = notification.get("timestamp")
-            if timestamp:
-                time_since = naturaltime(timestamp)
-                return f"{description} {time_since}"
-
-            return description
+    if not isinstance(notification, dict):
+        raise ValueError(
+            "The notification must be a dictionary with 'description' and 'timestamp' keys."
+        )
 
+    get = notification.get
+    description = get("description")
+    if not description:
         raise ValueError("No description provided.")
 
-    except AttributeError as e:
-        raise ValueError(
-            "The notification must be a dictionary with 'description' and 'timestamp' keys."
-        ) from e
+    timestamp = get("timestamp")
+    if timestamp:
+        time_since = naturaltime(timestamp)
+        return f"{description} {time_since}"
+
+    return description
@@ -1,9 +1,20 @@
-from typing import List
+import re
+from functools import lru_cache
+from typing import List, Tuple
 
 from django.core.checks import Error
-from django.utils.module_loading import import_string
 
-VALID_TIME_UNITS = ["second", "minute", "hour", "day"]
+from django_notification.utils.module_loading import import_optional_class
+
+# Ordered for display in hints; membership checks use the frozenset below.
+_VALID_TIME_UNITS_DISPLAY = ("second", "minute", "hour", "day")
+VALID_TIME_UNITS = frozenset(_VALID_TIME_UNITS_DISPLAY)
+
+# Matches every well-formed rate, e.g. "10/minute", in a single pass.
+THROTTLE_RATE_PATTERN = re.compile(rf"\d+/(?:{'|'.join(_VALID_TIME_UNITS_DISPLAY)})")
+
+# Marks "no element found", since None can itself be an invalid list element.
+_MISSING = object()
 
 
 def validate_boolean_setting(value: bool, config_name: str) -> List[Error]:
@@ -41,15 +52,18 @@ def validate_list_fields(
             )
         )
     else:
-        for field in fields:
-            if not isinstance(field, str):
-                errors.append(
-                    Error(
-                        f"Invalid type in {config_name}: {field} is not a string.",
-                        hint=f"Ensure all elements in {config_name} are strings.",
-                        id=f"django_notification.E004_{config_name}",
-                    )
+        # Stops at the first non-string element and reports it once
+        bad_field = next(
+            (field for field in fields if not isinstance(field, str)), _MISSING
+        )
+        if bad_field is not _MISSING:
+            errors.append(
+                Error(
+                    f"Invalid type in {config_name}: {bad_field!r} is not a string.",
+                    hint=f"Ensure all elements in {config_name} are strings.",
+                    id=f"django_notification.E004_{config_name}",
                 )
+            )
 
     return errors
 
@@ -58,6 +72,10 @@ def validate_throttle_rate(rate: str, setting_name: str) -> List[Error]:
     """
     Validates that a throttle rate is in the correct format: `{number}/{time_unit}`.
 
+    Well-formed rates are accepted by a single regex match. The outcome for each
+    string rate is cached, since Django runs the system checks repeatedly with
+    the same settings.
+
     Args:
         rate (str): The throttle rate to validate, e.g., "10/minute".
         setting_name (str): The name of the setting being validated (for error reporting).
@@ -65,15 +83,33 @@ def validate_throttle_rate(rate: str, setting_name: str) -> List[Error]:
     Returns:
         List[Error]: A list of errors if the rate is not valid, otherwise an empty list.
     """
-    errors = []
     if not isinstance(rate, str) or "/" not in rate:
-        errors.append(
+        return [
             Error(
                 f"'{setting_name}' must be an string in the format 'number/time_unit' (e.g., '10/minute').",
                 id="django_notification.E005",
             )
-        )
-        return errors
+        ]
+
+    return list(_validate_throttle_rate_format(rate, setting_name))
+
+
+@lru_cache(maxsize=128)
+def _validate_throttle_rate_format(rate: str, setting_name: str) -> Tuple[Error, ...]:
+    """Validate the `number/time_unit` parts of a string throttle rate.
+
+    Args:
+        rate (str): The throttle rate to validate, known to contain a "/".
+        setting_name (str): The name of the setting being validated (for error reporting).
+
+    Returns:
+        Tuple[Error, ...]: The validation errors, empty if the rate is valid.
+
+    """
+    if THROTTLE_RATE_PATTERN.fullmatch(rate):
+        return ()
+
+    errors = []
 
     # Split the rate into the number and the time unit
     parts = rate.split("/")
@@ -84,7 +120,7 @@ def validate_throttle_rate(rate: str, setting_name: str) -> List[Error]:
                 id="django_notification.E006",
             )
         )
-        return errors
+        return tuple(errors)
 
     number, time_unit = parts
 
@@ -102,12 +138,12 @@ def validate_throttle_rate(rate: str, setting_name: str) -> List[Error]:
         errors.append(
             Error(
                 f"'{setting_name}' has an invalid time unit: '{time_unit}'.",
-                hint=f"Valid time units are: {', '.join(VALID_TIME_UNITS)}.",
+                hint=f"Valid time units are: {', '.join(_VALID_TIME_UNITS_DISPLAY)}.",
                 id="django_notification.E008",
             )
         )
 
-    return errors
+    return tuple(errors)
 
 
 def validate_optional_class_setting(
@@ -140,9 +176,7 @@ def validate_optional_class_setting(
         return errors
 
     # Attempt to import the class from the given path
-    try:
-        import_string(setting_value)
-    except ImportError:
+    if not import_optional_class(setting_value)[0]:
         errors.append(
             Error(
                 f"Cannot import the class from the setting '{setting_name}'.",
@@ -194,17 +228,14 @@ def validate_optional_classes_setting(
                     id=f"django_notification.E012_{setting_name}",
                 )
             )
-        else:
-            # Attempt to import the class from the given path
-            try:
-                import_string(path)
-            except ImportError:
-                errors.append(
-                    Error(
-                        f"Cannot import the class from '{path}' in setting '{setting_name}'.",
-                        hint=f"Ensure that '{path}' is a valid importable class path.",
-                        id=f"django_notification.E013_{setting_name}",
-                    )
+        elif not import_optional_class(path)[0]:
+            # The class path could not be imported
+            errors.append(
+                Error(
+                    f"Cannot import the class from '{path}' in setting '{setting_name}'.",
+                    hint=f"Ensure that '{path}' is a valid importable class path.",
+                    id=f"django_notification.E013_{setting_name}",
                 )
+            )
 
     return errors